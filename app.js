@@ -62,13 +62,19 @@ const WIND_VIZ_CONFIG = {
     GLOW_BLUR: 7
 };
 
-// Funkcja mapowania wartości na kolor (skala Viridis)
-function getViridisColor(value, min, max) {
-    const t = Math.max(0, Math.min(1, (value - min) / (max - min)));
+// Tablica kolorów Viridis (256 wpisów) liczona raz przy ładowaniu skryptu
+const VIRIDIS_LUT = Array.from({ length: 256 }, (_, i) => {
+    const t = i / 255;
     const r = Math.round(255 * (0.267004 + 1.15172 * t - 2.92336 * t**2 + 1.52013 * t**3));
     const g = Math.round(255 * (0.018623 + 2.75701 * t - 4.49472 * t**2 + 1.77533 * t**3));
     const b = Math.round(255 * (0.354456 - 2.11226 * t + 10.5126 * t**2 - 12.3881 * t**3 + 3.63582 * t**4));
     return `rgba(${r},${g},${b},0.6)`;
+});
+
+// Funkcja mapowania wartości na kolor (skala Viridis)
+function getViridisColor(value, min, max) {
+    const t = Math.max(0, Math.min(1, (value - min) / (max - min)));
+    return VIRIDIS_LUT[Math.round(t * 255) | 0];
 }
 
 // Adapter danych - przekształca nasze dane na format oczekiwany przez wizualizację